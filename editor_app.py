@@ -16,6 +16,7 @@ from game_core.editor.config import (
 from game_core.editor.sidebar import Sidebar, SIDEBAR_WIDTH
 from game_core.editor.canvas import Canvas, CanvasControls
 from game_core.editor.canvas.new_map import NewMapButton
+from game_core.editor.dirty_tracker import DirtyTracker
 
 # NOTE: Avoid embedding placement logic directly in this file.
 from game_core.editor.sidebar.sidebar_tab_manager import TabManager
@@ -47,6 +48,10 @@ class EditorApp:
         )
         self.new_map_button = NewMapButton(self.sidebar.rect, self.canvas.placement_manager)
 
+        # Regions that must be redrawn; the first frame paints everything
+        self.dirty = DirtyTracker()
+        self.dirty.mark_all(self.screen.get_rect())
+
     def toggle_fullscreen(self) -> None:
         """Toggle fullscreen mode."""
         self.fullscreen = not self.fullscreen
@@ -62,6 +67,18 @@ class EditorApp:
         self.tab_manager.resize(self.sidebar.rect)
         self.new_map_button.resize(self.sidebar.rect)
 
+    def _mark_dirty(self, event: pygame.event.Event) -> None:
+        """Queue the screen regions affected by ``event`` for redraw."""
+        if event.type == pygame.MOUSEMOTION:
+            # Only the canvas reacts to hover (tile preview); include the
+            # previous position so a preview leaving the canvas is erased.
+            prev = (event.pos[0] - event.rel[0], event.pos[1] - event.rel[1])
+            if self.canvas.rect.collidepoint(event.pos) or self.canvas.rect.collidepoint(prev):
+                self.dirty.mark(self.canvas.rect)
+        else:
+            # Clicks, keys and window events may touch any component
+            self.dirty.mark_all(self.screen.get_rect())
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -75,6 +92,8 @@ class EditorApp:
                 self.new_map_button.resize(self.sidebar.rect)
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
                 self.toggle_fullscreen()
+            # After any window change, so a full redraw covers the new size
+            self._mark_dirty(event)
             self.tab_manager.handle_event(event)
             self.new_map_button.handle_event(event)
             handled = self.canvas_controls.handle_event(event)
@@ -85,15 +104,27 @@ class EditorApp:
 
     def update(self):
         # Allow long-press navigation on the canvas
-        self.canvas_controls.update()
+        if self.canvas_controls.update():
+            self.dirty.mark(self.canvas.rect)
 
     def draw(self):
+        dirty = self.dirty.pending()
+        if not dirty:
+            return  # Nothing changed since the last frame
+
+        # Restrict pixel work to the changed regions
+        self.screen.set_clip(dirty[0].unionall(dirty[1:]))
         self.screen.fill(BACKGROUND_COLOR)
-        self.canvas.draw(self.screen, self.tab_manager)
-        self.sidebar.draw(self.screen)
-        self.tab_manager.draw(self.screen)
-        self.new_map_button.draw(self.screen)
-        pygame.display.flip()
+        if self.dirty.is_dirty(self.canvas.rect):
+            self.canvas.draw(self.screen, self.tab_manager)
+        if self.dirty.is_dirty(self.sidebar.rect):
+            self.sidebar.draw(self.screen)
+            self.tab_manager.draw(self.screen)
+            self.new_map_button.draw(self.screen)
+        self.screen.set_clip(None)
+
+        pygame.display.update(dirty)
+        self.dirty.clear()
 
     def run(self):
         while self.running:
@@ -22,10 +22,51 @@ class Canvas:
         self.placement_manager = TilePlacementManager(grid_size)
         self.tilesets = TilesetRepository()
 
+        # Selected tiles scaled to the current zoom (and their translucent
+        # previews), keyed by source surface and dropped when the zoom changes
+        self._scaled_tiles: dict[pygame.Surface, pygame.Surface] = {}
+        self._preview_tiles: dict[pygame.Surface, pygame.Surface] = {}
+        self._scaled_grid = grid_size
+
     def resize(self, width: int, height: int, x: int = 0, y: int = 0) -> None:
         """Resize and reposition the canvas."""
         self.rect.update(x, y, width, height)
 
+    def _sync_scaled_cache(self) -> None:
+        """Drop scaled tiles built for a previous zoom level."""
+        if self.grid_size != self._scaled_grid:
+            self._scaled_tiles.clear()
+            self._preview_tiles.clear()
+            self._scaled_grid = self.grid_size
+
+    def _scaled_tile(self, tile: pygame.Surface) -> pygame.Surface:
+        """Return ``tile`` scaled to the current grid size, scaling it once per zoom."""
+        if self.grid_size == 16:
+            return tile
+        self._sync_scaled_cache()
+        scaled = self._scaled_tiles.get(tile)
+        if scaled is None:
+            factor = self.grid_size / 16
+            scaled = pygame.transform.scale(
+                tile,
+                (
+                    int(tile.get_width() * factor),
+                    int(tile.get_height() * factor),
+                ),
+            )
+            self._scaled_tiles[tile] = scaled
+        return scaled
+
+    def _preview_tile(self, tile: pygame.Surface) -> pygame.Surface:
+        """Return the translucent cursor preview for ``tile`` at the current zoom."""
+        self._sync_scaled_cache()
+        preview = self._preview_tiles.get(tile)
+        if preview is None:
+            preview = self._scaled_tile(tile).copy()
+            preview.set_alpha(150)
+            self._preview_tiles[tile] = preview
+        return preview
+
     def handle_event(self, event: pygame.event.Event, tab_manager: TabManager) -> None:
         """Handle mouse events for placing and removing tiles."""
 
@@ -46,15 +87,7 @@ class Canvas:
                 if tile_index is not None:
                     tile = self.tilesets.get_tile(tileset_index, tile_index)
                     if tile is not None:
-                        if self.grid_size != 16:
-                            factor = self.grid_size / 16
-                            tile = pygame.transform.scale(
-                                tile,
-                                (
-                                    int(tile.get_width() * factor),
-                                    int(tile.get_height() * factor),
-                                ),
-                            )
+                        tile = self._scaled_tile(tile)
 
                         for bx, by in iter_brush_positions(grid_x, grid_y, brush, shape):
                             self.placement_manager.add_tile(
@@ -80,15 +113,7 @@ class Canvas:
                 if tile_index is not None:
                     tile = self.tilesets.get_tile(tileset_index, tile_index)
                     if tile is not None:
-                        if self.grid_size != 16:
-                            factor = self.grid_size / 16
-                            tile = pygame.transform.scale(
-                                tile,
-                                (
-                                    int(tile.get_width() * factor),
-                                    int(tile.get_height() * factor),
-                                ),
-                            )
+                        tile = self._scaled_tile(tile)
                         for bx, by in iter_brush_positions(grid_x, grid_y, brush, shape):
                             self.placement_manager.add_tile(
                                 tile,
@@ -121,6 +146,7 @@ class Canvas:
             surface,
             tuple(self.offset),
             active_layer=tab_manager.active_layer,
+            view=self.rect,
         )
 
         # --------------------------------------------------------------
@@ -139,17 +165,7 @@ class Canvas:
             if tile_index is not None:
                 tile = self.tilesets.get_tile(tileset_index, tile_index)
                 if tile is not None:
-                    if self.grid_size != 16:
-                        factor = self.grid_size / 16
-                        tile = pygame.transform.scale(
-                            tile,
-                            (
-                                int(tile.get_width() * factor),
-                                int(tile.get_height() * factor),
-                            ),
-                        )
-                    preview = tile.copy()
-                    preview.set_alpha(150)
+                    preview = self._preview_tile(tile)
                     for bx, by in iter_brush_positions(grid_x, grid_y, brush, shape):
                         px = bx * self.grid_size - self.offset[0] + self.rect.left
                         py = by * self.grid_size - self.offset[1] + self.rect.top
@@ -28,9 +28,13 @@ class CanvasControls:
         self.canvas.offset[0] += dx
         self.canvas.offset[1] += dy
 
-    def update(self) -> None:
-        """Handle continuous panning when navigation keys are held."""
+    def update(self) -> bool:
+        """Handle continuous panning when navigation keys are held.
+
+        Returns True if the canvas moved and needs to be redrawn.
+        """
         keys = pygame.key.get_pressed()
+        old_offset = tuple(self.canvas.offset)
         if keys[pygame.K_w] or keys[pygame.K_UP]:
             self._pan(0, -self.PAN_SPEED)
         if keys[pygame.K_s] or keys[pygame.K_DOWN]:
@@ -39,6 +43,7 @@ class CanvasControls:
             self._pan(-self.PAN_SPEED, 0)
         if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
             self._pan(self.PAN_SPEED, 0)
+        return tuple(self.canvas.offset) != old_offset
 
     # ------------------------------------------------------------------
     # Zoom handling
@@ -64,13 +69,20 @@ class CanvasControls:
         self.canvas.offset[0] = int(self.canvas.offset[0] * scale)
         self.canvas.offset[1] = int(self.canvas.offset[1] * scale)
 
+        # Placed tiles share images, so scale each image/size pair only once
+        scaled: dict[tuple[pygame.Surface, tuple[int, int]], pygame.Surface] = {}
         for layer_tiles in self.canvas.placement_manager.layers:
             for tile in layer_tiles:
                 tile.rect.x = int(tile.rect.x * scale)
                 tile.rect.y = int(tile.rect.y * scale)
                 tile.rect.width = int(tile.rect.width * scale)
                 tile.rect.height = int(tile.rect.height * scale)
-                tile.image = pygame.transform.scale(tile.image, tile.rect.size)
+                key = (tile.image, tile.rect.size)
+                image = scaled.get(key)
+                if image is None:
+                    image = pygame.transform.scale(tile.image, tile.rect.size)
+                    scaled[key] = image
+                tile.image = image
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Process Pygame events for canvas controls.
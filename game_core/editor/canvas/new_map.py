@@ -4,7 +4,7 @@ from __future__ import annotations
 import pygame
 
 from ..color_palette import DARK_GRAY, SIDEBAR_BORDER, WHITE
-from ..config import FONT_PATH
+from ..editor_font import get_editor_font
 from .tile_placement import TilePlacementManager
 
 
@@ -17,7 +17,7 @@ class NewMapButton:
 
     def __init__(self, sidebar_rect: pygame.Rect, placement_manager: TilePlacementManager) -> None:
         self.sidebar_rect = sidebar_rect
-        self.font = pygame.font.Font(FONT_PATH, 16)
+        self.font = get_editor_font(16)
         self.placement_manager = placement_manager
 
     def resize(self, sidebar_rect: pygame.Rect) -> None:
@@ -4,32 +4,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Tuple
 
 import pygame
 
 
-@dataclass
+@dataclass(eq=False)
 class PlacedTile:
-    """Data structure for a tile placed on the canvas."""
+    """Data structure for a tile placed on the canvas.
+
+    Tiles compare by identity so removing one from a layer list is a plain
+    pointer scan.
+    """
 
     image: pygame.Surface
     rect: pygame.Rect
-
-    def draw(
-        self,
-        surface: pygame.Surface,
-        offset: tuple[int, int] = (0, 0),
-        alpha: int = 255,
-    ) -> None:
-        """Blit the tile image onto ``surface`` taking offset and transparency into account."""
-
-        if alpha != 255:
-            image = self.image.copy()
-            image.set_alpha(alpha)
-        else:
-            image = self.image
-        surface.blit(image, self.rect.move(-offset[0], -offset[1]))
+    # Grid cell the tile was placed at and whether it covers more than one cell
+    cell: Tuple[int, int] | None = None
+    spans: bool = False
 
 
 class TilePlacementManager:
@@ -39,6 +31,13 @@ class TilePlacementManager:
         self.grid_size = grid_size
         # Each element in ``layers`` is a list of ``PlacedTile`` objects.
         self.layers: List[List[PlacedTile]] = [[]]
+        # Per layer: tiles keyed by the grid cell they were placed at (in
+        # layer order) and how many of them span several cells
+        self._cells: List[Dict[Tuple[int, int], List[PlacedTile]]] = [{}]
+        self._spanning: List[int] = [0]
+        # Translucent copies of images on inactive layers, valid for one zoom
+        self._faded: Dict[pygame.Surface, pygame.Surface] = {}
+        self._faded_grid = grid_size
 
     def _grid_to_pixels(self, x: int, y: int) -> tuple[int, int]:
         """Convert grid coordinates to pixel coordinates."""
@@ -47,7 +46,7 @@ class TilePlacementManager:
     def ensure_layer(self, index: int) -> None:
         """Ensure that the layer list is long enough for ``index``."""
         while len(self.layers) <= index:
-            self.layers.append([])
+            self.add_layer()
 
     def add_tile(
         self,
@@ -71,30 +70,52 @@ class TilePlacementManager:
         width = width or image.get_width()
         height = height or image.get_height()
         rect = pygame.Rect(px, py, width, height)
-        self.layers[layer].append(PlacedTile(image, rect))
+        spans = width > self.grid_size or height > self.grid_size
+        tile = PlacedTile(image, rect, (grid_x, grid_y), spans)
+        self.layers[layer].append(tile)
+        self._cells[layer].setdefault(tile.cell, []).append(tile)
+        if tile.spans:
+            self._spanning[layer] += 1
         return rect
 
+    def _tile_at(self, px: int, py: int, cell: Tuple[int, int], layer: int) -> PlacedTile | None:
+        """Return the first tile on ``layer`` covering the given position."""
+        if not self._spanning[layer]:
+            # Single-cell tiles only cover the cell they were placed at
+            tiles = self._cells[layer].get(cell)
+            return tiles[0] if tiles else None
+        for tile in self.layers[layer]:
+            if tile.rect.collidepoint(px, py):
+                return tile
+        return None
+
     def remove_tile_at(self, grid_x: int, grid_y: int, layer: int = 0) -> None:
         """Remove the first tile found at the given grid position on a layer."""
         if layer >= len(self.layers):
             return
         px, py = self._grid_to_pixels(grid_x, grid_y)
-        for tile in list(self.layers[layer]):
-            if tile.rect.collidepoint(px, py):
-                self.layers[layer].remove(tile)
-                break
+        tile = self._tile_at(px, py, (grid_x, grid_y), layer)
+        if tile is None:
+            return
+        self.layers[layer].remove(tile)
+        bucket = self._cells[layer][tile.cell]
+        bucket.remove(tile)
+        if not bucket:
+            del self._cells[layer][tile.cell]
+        if tile.spans:
+            self._spanning[layer] -= 1
 
     def has_tile_at(self, grid_x: int, grid_y: int, layer: int | None = None) -> bool:
         """Return True if a tile occupies the given grid position."""
         px, py = self._grid_to_pixels(grid_x, grid_y)
+        cell = (grid_x, grid_y)
         if layer is None:
             return any(
-                tile.rect.collidepoint(px, py)
-                for layer_tiles in self.layers
-                for tile in layer_tiles
+                self._tile_at(px, py, cell, index) is not None
+                for index in range(len(self.layers))
             )
         if 0 <= layer < len(self.layers):
-            return any(tile.rect.collidepoint(px, py) for tile in self.layers[layer])
+            return self._tile_at(px, py, cell, layer) is not None
         return False
 
     def draw(
@@ -102,29 +123,62 @@ class TilePlacementManager:
         surface: pygame.Surface,
         offset: tuple[int, int] = (0, 0),
         active_layer: int | None = None,
+        view: pygame.Rect | None = None,
     ) -> None:
         """Draw all placed tiles onto the provided surface.
 
         ``active_layer`` controls which layer is fully opaque. Other layers are
-        rendered semi-transparently.
+        rendered semi-transparently. Tiles outside ``view`` (screen space,
+        further limited to the surface's clip) are skipped.
         """
 
+        visible = surface.get_clip()
+        if view is not None:
+            visible = visible.clip(view)
+        # Compare against tile rects in canvas space rather than moving each one
+        visible.move_ip(offset)
+        ox, oy = offset
+        if self.grid_size != self._faded_grid:
+            self._faded.clear()
+            self._faded_grid = self.grid_size
+
+        # Every visible tile in layer order, handed to SDL in a single call
+        sequence = []
         for idx, layer_tiles in enumerate(self.layers):
-            alpha = 255 if active_layer is None or idx == active_layer else 128
+            opaque = active_layer is None or idx == active_layer
             for tile in layer_tiles:
-                tile.draw(surface, offset, alpha)
+                if visible.colliderect(tile.rect):
+                    image = tile.image if opaque else self._faded_image(tile.image)
+                    sequence.append((image, tile.rect.move(-ox, -oy)))
+        surface.blits(sequence, doreturn=False)
+
+    def _faded_image(self, image: pygame.Surface) -> pygame.Surface:
+        """Return the half-transparent copy of ``image`` used for inactive layers."""
+        faded = self._faded.get(image)
+        if faded is None:
+            faded = image.copy()
+            faded.set_alpha(128)
+            self._faded[image] = faded
+        return faded
 
     # Layer management -------------------------------------------------
     def add_layer(self) -> None:
         """Append a new empty layer."""
         self.layers.append([])
+        self._cells.append({})
+        self._spanning.append(0)
 
     def delete_layer(self, index: int) -> None:
         """Delete a layer and all its tiles if multiple layers exist."""
         if 0 <= index < len(self.layers) and len(self.layers) > 1:
             self.layers.pop(index)
+            self._cells.pop(index)
+            self._spanning.pop(index)
 
     def clear(self) -> None:
         """Remove all tiles and reset to a single empty layer."""
         self.layers = [[]]
+        self._cells = [{}]
+        self._spanning = [0]
+        self._faded.clear()
 
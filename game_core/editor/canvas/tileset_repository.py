@@ -11,24 +11,26 @@ from ..tileset_tab.tileset_components import (
     DungeonAnimTileset,
     PlayerSpawnpointTileset,
     EnemySpawnpointTileset,
+    get_tileset,
 )
 
 
 class TilesetRepository:
     """Load and provide tile surfaces for placement."""
 
-    def __init__(self) -> None:
-        self._tilesets = [
-            OverworldTileset(),
-            OverworldAnimTileset(),
-            DungeonTileset(),
-            DungeonAnimTileset(),
-            PlayerSpawnpointTileset(),
-            EnemySpawnpointTileset(),
-        ]
+    # Indexed by the sidebar's tileset tab order
+    TILESET_CLASSES = (
+        OverworldTileset,
+        OverworldAnimTileset,
+        DungeonTileset,
+        DungeonAnimTileset,
+        PlayerSpawnpointTileset,
+        EnemySpawnpointTileset,
+    )
 
     def get_tile(self, tileset_index: int, tile_index: int) -> pygame.Surface | None:
         """Return a tile from the specified tileset."""
-        if 0 <= tileset_index < len(self._tilesets):
-            return self._tilesets[tileset_index].get_tile(tile_index)
+        if 0 <= tileset_index < len(self.TILESET_CLASSES):
+            # Shared with the palettes, so tiles are loaded once on first use
+            return get_tileset(self.TILESET_CLASSES[tileset_index]).get_tile(tile_index)
         return None
@@ -0,0 +1,48 @@
+"""Dirty-rectangle tracking for partial screen updates."""
+# Collects screen regions that need redrawing so idle frames cost nothing.
+
+from __future__ import annotations
+
+import pygame
+
+
+class DirtyTracker:
+    """Accumulate dirty screen regions between frames."""
+
+    def __init__(self) -> None:
+        self._rects: list[pygame.Rect] = []
+        self._full: pygame.Rect | None = None
+
+    def mark(self, rect: pygame.Rect) -> None:
+        """Queue ``rect`` for redraw on the next frame."""
+        if self._full is not None or rect.width <= 0 or rect.height <= 0:
+            return
+        # Skip regions already covered by a queued rect
+        if any(queued.contains(rect) for queued in self._rects):
+            return
+        self._rects.append(rect.copy())
+
+    def mark_all(self, screen_rect: pygame.Rect) -> None:
+        """Queue the entire screen for redraw."""
+        self._full = screen_rect.copy()
+        self._rects = []
+
+    def is_dirty(self, rect: pygame.Rect) -> bool:
+        """Return True if any queued region overlaps ``rect``."""
+        if self._full is not None:
+            return True
+        return rect.collidelist(self._rects) != -1
+
+    def pending(self) -> list[pygame.Rect]:
+        """Return the regions queued for the current frame."""
+        if self._full is not None:
+            return [self._full]
+        return list(self._rects)
+
+    def clear(self) -> None:
+        """Forget all queued regions once they have been presented."""
+        self._rects = []
+        self._full = None
+
+
+__all__ = ["DirtyTracker"]
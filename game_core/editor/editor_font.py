@@ -0,0 +1,24 @@
+"""Shared font access for the editor's UI components."""
+# Caches fonts loaded from config.FONT_PATH so each size is parsed once.
+
+from __future__ import annotations
+
+import pygame
+
+from .config import FONT_PATH
+
+# Loaded fonts keyed by (path, size)
+_font_cache: dict[tuple[str, int], pygame.font.Font] = {}
+
+
+def get_editor_font(size: int = 16) -> pygame.font.Font:
+    """Return the editor font at ``size``, loading it on first use."""
+    key = (FONT_PATH, size)
+    font = _font_cache.get(key)
+    if font is None:
+        font = pygame.font.Font(FONT_PATH, size)
+        _font_cache[key] = font
+    return font
+
+
+__all__ = ["get_editor_font"]
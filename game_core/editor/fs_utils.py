@@ -0,0 +1,34 @@
+"""Filesystem helpers shared by the editor's asset loaders."""
+# Memoizes directory listings that do not change while the editor runs.
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+
+
+def is_png(name: str) -> bool:
+    """Return True if ``name`` has a PNG extension, in any letter case."""
+    return name[-4:].lower() == ".png"
+
+
+@lru_cache(maxsize=64)
+def sorted_pngs(folder: str) -> tuple[str, ...]:
+    """Return the names of PNG files in ``folder`` in sorted order.
+
+    Results are cached per folder; call ``sorted_pngs.cache_clear()`` after
+    assets change on disk.
+    """
+    return tuple(sorted(name for name in os.listdir(folder) if is_png(name)))
+
+
+def sorted_subdirs(folder: str) -> list[str]:
+    """Return paths of the subdirectories of ``folder``, sorted by name."""
+    # DirEntry reuses the type from readdir, so no extra stat per entry
+    with os.scandir(folder) as it:
+        entries = [entry for entry in it if entry.is_dir()]
+    entries.sort(key=lambda entry: entry.name)
+    return [entry.path for entry in entries]
+
+
+__all__ = ["is_png", "sorted_pngs", "sorted_subdirs"]
@@ -5,9 +5,14 @@ import os
 # Loads images on demand and caches them across the application.
 import pygame
 import weakref
-from typing import Dict, Optional, Tuple, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple, List
 import gc
 
+from .fs_utils import sorted_pngs
+
+
 class SpriteCache:
     """
     Centralized sprite caching system that reduces memory usage by avoiding duplicate image loads.
@@ -42,9 +47,16 @@ class SpriteCache:
             self._max_cache_size = 1000  # Maximum number of cached images
             self._max_scaled_cache_size = 2000  # Maximum number of scaled sprites
 
+            # Pixel memory held by the main cache, evicted LRU beyond the budget
+            self._cache_bytes = 0
+            self._max_cache_bytes = 128 * 1024 * 1024
+
             # Working directory for relative paths
             self._base_path = os.getcwd()
 
+            # Guards cache bookkeeping when sprites are loaded from worker threads
+            self._lock = threading.RLock()
+
             SpriteCache._initialized = True
     
     def get_sprite(self, path: str, convert_alpha: bool = True) -> Optional[pygame.Surface]:
@@ -62,13 +74,38 @@ class SpriteCache:
         normalized_path = self._normalize_path(path)
         
         # Check if already cached
-        if normalized_path in self._cache:
-            self._cache_hits += 1
-            return self._cache[normalized_path]
+        cached = self._cached_sprite(normalized_path)
+        if cached is not None:
+            return cached
         
-        # Load the image
-        sprite = self._load_image(normalized_path, convert_alpha)
-        if sprite is not None:
+        image = self._read_image(normalized_path)
+        if image is None:
+            return None
+        sprite = self._convert_image(image, convert_alpha)
+        # Only cache display-format surfaces; before set_mode the raw image is
+        # returned uncached so a later call can convert it
+        if sprite is not None and sprite is not image:
+            sprite = self._store_sprite(normalized_path, sprite)
+        
+        return sprite
+
+    def _cached_sprite(self, normalized_path: str) -> Optional[pygame.Surface]:
+        """Return a cached sprite and mark it most recently used."""
+        with self._lock:
+            cached = self._cache.pop(normalized_path, None)
+            if cached is not None:
+                # Re-insert so dict order tracks recency for LRU eviction
+                self._cache[normalized_path] = cached
+                self._cache_hits += 1
+            return cached
+
+    def _store_sprite(self, normalized_path: str, sprite: pygame.Surface) -> pygame.Surface:
+        """Cache a freshly loaded sprite, returning any copy cached meanwhile."""
+        with self._lock:
+            cached = self._cache.get(normalized_path)
+            if cached is not None:
+                return cached
+
             # Cache the sprite if we haven't exceeded the limit
             if len(self._cache) < self._max_cache_size:
                 self._cache[normalized_path] = sprite
@@ -76,10 +113,50 @@ class SpriteCache:
                 # If cache is full, remove oldest entries (simple LRU approximation)
                 self._cleanup_cache()
                 self._cache[normalized_path] = sprite
-            
+            self._cache_bytes += self._surface_bytes(sprite)
+            self._evict_over_budget()
+
             self._cache_misses += 1
-        
         return sprite
+
+    def get_sprites(self, paths: Iterable[str], convert_alpha: bool = True,
+                    max_workers: int = 8) -> List[Optional[pygame.Surface]]:
+        """
+        Load several sprites in parallel, preserving the order of ``paths``.
+        
+        Args:
+            paths: Image paths to load (relative or absolute)
+            convert_alpha (bool): Whether to convert the images with alpha channel
+            max_workers (int): Upper bound on loader threads
+            
+        Returns:
+            List of loaded sprites, with None for files that failed to load
+        """
+        paths = list(paths)
+        if len(paths) <= 1:
+            return [self.get_sprite(path, convert_alpha) for path in paths]
+        normalized = [self._normalize_path(path) for path in paths]
+        with self._lock:
+            missing = list(dict.fromkeys(path for path in normalized if path not in self._cache))
+
+        # Workers only read and decode (both release the GIL); pixel format
+        # conversion and cache bookkeeping stay on the calling thread
+        decoded: Dict[str, Optional[pygame.Surface]] = {}
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+                decoded = dict(zip(missing, executor.map(self._read_image, missing)))
+
+        sprites = []
+        for path in normalized:
+            sprite = self._cached_sprite(path)
+            if sprite is None:
+                image = decoded.pop(path, None)
+                if image is not None:
+                    sprite = self._convert_image(image, convert_alpha)
+                if sprite is not None and sprite is not image:
+                    sprite = self._store_sprite(path, sprite)
+            sprites.append(sprite)
+        return sprites
     
     def get_sprite_from_sheet(self, sheet_path: str, rect: Tuple[int, int, int, int], 
                             convert_alpha: bool = True) -> Optional[pygame.Surface]:
@@ -112,8 +189,8 @@ class SpriteCache:
             x, y, width, height = rect
             sprite = sheet.subsurface((x, y, width, height)).copy()
             
-            # Cache the extracted sprite
-            if len(self._sprite_sheet_cache) < self._max_cache_size:
+            # Cache the extracted sprite once it is in display format
+            if self._display_ready() and len(self._sprite_sheet_cache) < self._max_cache_size:
                 self._sprite_sheet_cache[cache_key] = sprite
             
             self._cache_misses += 1
@@ -138,9 +215,8 @@ class SpriteCache:
         frames = []
         
         try:
-            # Get all PNG files in the folder
-            frame_files = [f for f in os.listdir(normalized_folder) if f.endswith('.png')]
-            frame_files.sort()  # Ensure consistent order
+            # Sorted PNG names; the listing is memoized per folder
+            frame_files = sorted_pngs(normalized_folder)
             
             for i, frame_file in enumerate(frame_files):
                 cache_key = (normalized_folder, i)
@@ -157,8 +233,8 @@ class SpriteCache:
                     if frame is not None:
                         frames.append(frame)
                         
-                        # Cache the frame
-                        if len(self._animation_cache) < self._max_cache_size:
+                        # Cache the frame once it is in display format
+                        if self._display_ready() and len(self._animation_cache) < self._max_cache_size:
                             self._animation_cache[cache_key] = frame
                         
                         self._cache_misses += 1
@@ -205,7 +281,9 @@ class SpriteCache:
             scaled_sprite = pygame.transform.scale(original_sprite, size)
 
             # Cache the scaled sprite if we haven't exceeded the limit
-            if len(self._scaled_cache) < self._max_scaled_cache_size:
+            if not self._display_ready():
+                pass  # Source not in display format yet; scale again later
+            elif len(self._scaled_cache) < self._max_scaled_cache_size:
                 self._scaled_cache[cache_key] = scaled_sprite
             else:
                 # If cache is full, remove oldest entries
@@ -237,23 +315,58 @@ class SpriteCache:
         Returns:
             pygame.Surface: The loaded image, or None if loading failed
         """
+        image = self._read_image(path)
+        if image is None:
+            return None
+        return self._convert_image(image, convert_alpha)
+
+    @staticmethod
+    def _display_ready() -> bool:
+        """Return True once a display mode exists and surfaces can be converted."""
+        return pygame.display.get_surface() is not None
+
+    @staticmethod
+    def _read_image(path: str) -> Optional[pygame.Surface]:
+        """Read and decode an image without touching the display."""
         try:
             if not os.path.exists(path):
                 pass  # Image file not found
                 return None
             
-            image = pygame.image.load(path)
-            if convert_alpha:
-                image = image.convert_alpha()
-            else:
-                image = image.convert()
-            
-            return image
+            return pygame.image.load(path)
             
         except Exception as e:
             pass  # Error loading image
             return None
+
+    @staticmethod
+    def _convert_image(image: pygame.Surface, convert_alpha: bool = True) -> Optional[pygame.Surface]:
+        """Convert a decoded image to the display format when a display exists."""
+        # Converting needs a display mode; before that keep the raw surface
+        if not SpriteCache._display_ready():
+            return image
+        try:
+            if convert_alpha:
+                return image.convert_alpha()
+            return image.convert()
+        except Exception as e:
+            pass  # Error converting image
+            return None
     
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        """Approximate pixel memory used by a surface."""
+        return surface.get_pitch() * surface.get_height()
+
+    def _evict_over_budget(self):
+        """Drop least recently used sprites until the byte budget is met.
+
+        Callers holding a sprite keep it alive; only the cache's reference goes.
+        """
+        while self._cache_bytes > self._max_cache_bytes and len(self._cache) > 1:
+            oldest = next(iter(self._cache))
+            self._cache_bytes -= self._surface_bytes(self._cache.pop(oldest))
+
     def _cleanup_cache(self):
         """Remove some entries from cache when it gets too full."""
         # Simple cleanup: remove 20% of entries
@@ -262,7 +375,7 @@ class SpriteCache:
         # Remove oldest entries (this is a simple approximation)
         keys_to_remove = list(self._cache.keys())[:cleanup_count]
         for key in keys_to_remove:
-            del self._cache[key]
+            self._cache_bytes -= self._surface_bytes(self._cache.pop(key))
 
         # Also cleanup sprite sheet cache
         if len(self._sprite_sheet_cache) > self._max_cache_size // 2:
@@ -283,16 +396,19 @@ class SpriteCache:
     
     def clear_cache(self):
         """Clear all cached sprites to free memory."""
-        self._cache.clear()
-        self._sprite_sheet_cache.clear()
-        self._animation_cache.clear()
-        self._scaled_cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+            self._sprite_sheet_cache.clear()
+            self._animation_cache.clear()
+            self._scaled_cache.clear()
         gc.collect()  # Force garbage collection
     
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics for debugging and optimization."""
         return {
             'cache_size': len(self._cache),
+            'cache_bytes': self._cache_bytes,
             'sprite_sheet_cache_size': len(self._sprite_sheet_cache),
             'animation_cache_size': len(self._animation_cache),
             'scaled_cache_size': len(self._scaled_cache),
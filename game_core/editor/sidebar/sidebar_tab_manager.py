@@ -6,12 +6,13 @@ from __future__ import annotations
 import pygame
 
 from ..color_palette import LIGHT_GRAY, DARK_GRAY, SIDEBAR_BORDER, WHITE
-from ..config import FONT_PATH
+from ..editor_font import get_editor_font
 from ..tileset_tab.tileset_palettes import TilesetPalettes
 from ..tileset_tab.tileset_brush import TilesetBrush
 from ..tileset_tab.tileset_layer import TilesetLayers
 from ..canvas.tile_placement import TilePlacementManager
 from ..tileset_tab.tile_selection_manager import TileSelectionManager
+from ..tileset_tab.tileset_components import unload_tilesets
 
 
 class TabManager:
@@ -26,7 +27,7 @@ class TabManager:
         self.tabs = tabs
         self.active = 0
         self.sidebar_rect = sidebar_rect
-        self.font = pygame.font.Font(FONT_PATH, 16)
+        self.font = get_editor_font(16)
         self.placement_manager = placement_manager
 
         # Tile selection manager used by the tileset palettes
@@ -76,6 +77,9 @@ class TabManager:
             mx, my = event.pos
             for index, rect in enumerate(self._tab_rects()):
                 if rect.collidepoint(mx, my):
+                    if self.tabs[self.active] == "tiles" and self.tabs[index] != "tiles":
+                        # Leaving the tiles tab: release palette tiles until reopened
+                        unload_tilesets()
                     self.active = index
                     break
 
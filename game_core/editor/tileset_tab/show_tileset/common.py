@@ -2,11 +2,54 @@
 from __future__ import annotations
 # Calculates layout for tile grids.
 
-from typing import Protocol, List
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Protocol, List, Sequence
 import pygame
 
+from ..tileset_components import add_unload_callback
+from ..tile_selection_manager import TileGrid
+from ..tileset_tab_constants import PALETTE_OFFSET_Y
+
+# Scaled tile surfaces keyed by (id(tile), width, height). The source tile is
+# stored alongside the result so its id cannot be reused while cached.
+_SCALED_CACHE_SIZE = 512
+_scaled_cache: OrderedDict[tuple[int, int, int], tuple[pygame.Surface, pygame.Surface]] = OrderedDict()
+
+# Size metrics of each loaded tile list keyed by id(tileset.tiles). The list
+# is static after loading, so it only has to be scanned once.
+_size_cache: dict[int, tuple[Sequence[pygame.Surface], int, "TileMetrics"]] = {}
+
+# Atlases kept per tileset; layouts differ by sidebar size, so each resize
+# can add one. Older layouts are evicted least recently used first.
+_ATLAS_CACHE_SIZE = 4
+
+# One renderer per tileset, keyed by id(tileset). Each renderer holds its
+# tileset, so the id cannot be reused while the entry exists.
+_renderers: dict[int, "PaletteRenderer"] = {}
+
+
+class TileMetrics(NamedTuple):
+    """Pixel sizes of a tile list gathered in a single pass."""
+
+    sizes: List[tuple[int, int]]
+    max_height: int
+    row_widths: List[int]  # Unscaled sum of tile widths per palette row
+
+
+class TileRects(List[pygame.Rect]):
+    """Screen rects of a drawn palette plus layout metadata.
+
+    Built once per layout change and returned as-is on unchanged frames, so
+    callers must treat it as read-only.
+    """
+
+    grid: TileGrid | None = None
+    bottom: int | None = None  # Lowest tile edge, precomputed for layout
+
+
 class TilesetProtocol(Protocol):
     TILE_SIZE: int
+    tiles: Sequence[pygame.Surface]
 
     def tiles_per_row(self) -> int:
         ...
@@ -18,9 +61,184 @@ class TilesetProtocol(Protocol):
         ...
 
 
-def draw_tileset(surface: pygame.Surface, sidebar_rect: pygame.Rect, tileset: TilesetProtocol) -> List[pygame.Rect]:
+def scale_tile(tile: pygame.Surface, width: int, height: int) -> pygame.Surface:
+    """Return ``tile`` scaled to ``(width, height)``, reusing cached results."""
+    key = (id(tile), width, height)
+    entry = _scaled_cache.get(key)
+    if entry is not None:
+        _scaled_cache.move_to_end(key)
+        return entry[1]
+
+    if tile.get_size() == (width, height):
+        scaled = tile  # Scale factor of 1, nothing to resample
+    else:
+        scaled = pygame.transform.scale(tile, (width, height))
+    _scaled_cache[key] = (tile, scaled)
+    if len(_scaled_cache) > _SCALED_CACHE_SIZE:
+        _scaled_cache.popitem(last=False)  # Evict the least recently used
+    return scaled
+
+
+def invalidate_palette_cache() -> None:
+    """Drop cached scaled tiles and atlases (call when a tileset is (re)loaded)."""
+    _scaled_cache.clear()
+    _size_cache.clear()
+    _renderers.clear()
+
+
+# Atlases and scaled tiles hold tile surfaces, so drop them with the tilesets
+add_unload_callback(invalidate_palette_cache)
+
+
+def tile_metrics(tileset: TilesetProtocol) -> TileMetrics:
+    """Return sizes, tallest height and row widths of non-empty tiles.
+
+    All three are collected in one traversal and cached per tile list.
+    """
+    tiles = tileset.tiles
+    tiles_per_row = tileset.tiles_per_row()
+    entry = _size_cache.get(id(tiles))
+    if entry is not None and entry[1] == tiles_per_row:
+        return entry[2]
+
+    sizes: List[tuple[int, int]] = []
+    row_widths: List[int] = []
+    max_height = 0
+    for tile in tiles:
+        if tile is None:
+            continue
+        width, height = tile.get_size()
+        if len(sizes) % tiles_per_row == 0:
+            row_widths.append(0)
+        row_widths[-1] += width
+        if height > max_height:
+            max_height = height
+        sizes.append((width, height))
+
+    metrics = TileMetrics(sizes, max_height, row_widths)
+    # Keep a reference to the list so its id stays unique while cached
+    _size_cache[id(tiles)] = (tiles, tiles_per_row, metrics)
+    return metrics
+
+
+def _palette_state(sidebar_rect: pygame.Rect, tileset: TilesetProtocol) -> tuple:
+    """Return the inputs that determine a palette's layout."""
+    return tuple(sidebar_rect), tileset.tile_count(), id(tileset.tiles)
+
+
+def _compose_atlas(
+    placements: List[tuple[pygame.Surface, pygame.Rect]],
+) -> tuple[pygame.Surface, List[pygame.Rect]]:
+    """Render scaled tiles into one transparent surface at their local rects."""
+    rects = [rect for _tile, rect in placements]
+    width = max((r.right for r in rects), default=0)
+    height = max((r.bottom for r in rects), default=0)
+    atlas = pygame.Surface((max(width, 1), max(height, 1)), pygame.SRCALPHA)
+
+    # Hand every tile to SDL in one call instead of one blit() per tile
+    sequence = [(tile, rect.topleft) for tile, rect in placements]
+    fblits = getattr(atlas, "fblits", None)  # pygame-ce only
+    if fblits is not None:
+        fblits(sequence)
+    else:
+        atlas.blits(sequence, doreturn=False)
+    # Match the display's pixel format so the per-frame blit is a plain copy
+    if pygame.display.get_surface() is not None:
+        atlas = atlas.convert_alpha()
+    return atlas, rects
+
+
+class PaletteRenderer:
+    """Off-screen palette cache for a single tileset.
+
+    Holds pre-composed atlases keyed by layout and remembers the last drawn
+    layout, so unchanged frames are a single blit.
+    """
+
+    def __init__(self, tileset: TilesetProtocol) -> None:
+        self.tileset = tileset
+        # Layout key -> (atlas surface, tile rects relative to its origin)
+        self._atlases: OrderedDict[tuple, tuple[pygame.Surface, List[pygame.Rect]]] = OrderedDict()
+        self._state: tuple | None = None
+        self._surface: pygame.Surface | None = None
+        self._origin = (0, 0)
+        self._rects = TileRects()
+
+    def invalidate(self) -> None:
+        """Forget cached atlases so the next draw rebuilds them."""
+        self._atlases.clear()
+        self._state = None
+
+    def draw_cached(self, surface: pygame.Surface, sidebar_rect: pygame.Rect) -> TileRects | None:
+        """Redraw the last palette if its inputs are unchanged.
+
+        Returns the cached tile rects, or None when the layout must be recomputed.
+        """
+        if self._state is None or self._state != _palette_state(sidebar_rect, self.tileset):
+            return None
+        surface.blit(self._surface, self._origin)
+        return self._rects
+
+    def blit_atlas(
+        self,
+        surface: pygame.Surface,
+        sidebar_rect: pygame.Rect,
+        key: tuple,
+        build: Callable[[], List[tuple[pygame.Surface, pygame.Rect]]],
+        origin: tuple[int, int],
+        grid: TileGrid | None = None,
+    ) -> TileRects:
+        """Blit the cached atlas for ``key`` at ``origin`` and return screen rects.
+
+        ``build`` is only called on a cache miss and must return the scaled
+        tiles paired with their rects relative to the atlas origin. ``grid``
+        describes a uniform layout relative to the origin.
+        """
+        entry = self._atlases.get(key)
+        if entry is None:
+            entry = _compose_atlas(build())
+            self._atlases[key] = entry
+            if len(self._atlases) > _ATLAS_CACHE_SIZE:
+                self._atlases.popitem(last=False)  # Evict the least recently used
+        else:
+            self._atlases.move_to_end(key)
+
+        atlas, local_rects = entry
+        surface.blit(atlas, origin)
+        ox, oy = origin
+        rects = TileRects(rect.move(ox, oy) for rect in local_rects)
+        if rects:
+            rects.bottom = max(rect.bottom for rect in rects)
+        if grid is not None:
+            rects.grid = grid._replace(left=grid.left + ox, top=grid.top + oy)
+
+        self._state = _palette_state(sidebar_rect, self.tileset)
+        self._surface = atlas
+        self._origin = origin
+        self._rects = rects
+        return rects
+
+
+def palette_renderer(tileset: TilesetProtocol) -> PaletteRenderer:
+    """Return the shared renderer for ``tileset``, creating it on first use."""
+    renderer = _renderers.get(id(tileset))
+    if renderer is None:
+        renderer = PaletteRenderer(tileset)
+        _renderers[id(tileset)] = renderer
+    return renderer
+
+
+def draw_tileset(
+    surface: pygame.Surface,
+    sidebar_rect: pygame.Rect,
+    tileset: TilesetProtocol,
+    max_scale: float = 2,
+) -> TileRects:
     """Render a tileset inside the sidebar and return rectangles for each tile."""
-    from ..tileset_palettes import TilesetPalettes
+    renderer = palette_renderer(tileset)
+    cached = renderer.draw_cached(surface, sidebar_rect)
+    if cached is not None:
+        return cached
 
     spacing = 2
     tile_size = tileset.TILE_SIZE
@@ -28,7 +246,7 @@ def draw_tileset(surface: pygame.Surface, sidebar_rect: pygame.Rect, tileset: Ti
     tiles_per_row = tileset.tiles_per_row()
     rows = (tileset.tile_count() + tiles_per_row - 1) // tiles_per_row
 
-    offset_y = TilesetPalettes.PADDING * 3 + TilesetPalettes.TAB_HEIGHT * 2
+    offset_y = PALETTE_OFFSET_Y
 
     available_width = sidebar_rect.width
     available_height = sidebar_rect.height - offset_y
@@ -36,7 +254,7 @@ def draw_tileset(surface: pygame.Surface, sidebar_rect: pygame.Rect, tileset: Ti
     scale_w = (available_width - spacing * tiles_per_row) / (tile_size * tiles_per_row)
     scale_h = (available_height - spacing * (rows - 1)) / (tile_size * rows)
 
-    scale = min(scale_w, scale_h, 2)
+    scale = min(scale_w, scale_h, max_scale)
     if scale <= 0:
         scale = 1
 
@@ -46,15 +264,118 @@ def draw_tileset(surface: pygame.Surface, sidebar_rect: pygame.Rect, tileset: Ti
     start_x = sidebar_rect.left + max((available_width - grid_width) // 2, 0)
     start_y = sidebar_rect.top + offset_y
 
-    rects: List[pygame.Rect] = []
-    for i in range(tileset.tile_count()):
-        tile = tileset.get_tile(i)
-        if tile is None:
-            continue
-        dest_x = start_x + (i % tiles_per_row) * (scaled_size + spacing)
-        dest_y = start_y + (i // tiles_per_row) * (scaled_size + spacing)
-        scaled = pygame.transform.scale(tile, (scaled_size, scaled_size))
-        surface.blit(scaled, (dest_x, dest_y))
-        rects.append(pygame.Rect(dest_x, dest_y, scaled_size, scaled_size))
+    def build() -> List[tuple[pygame.Surface, pygame.Rect]]:
+        # Column offsets are shared by every row; only dest_y changes per row
+        tiles = tileset.tiles
+        stride = scaled_size + spacing
+        x_positions = [col * stride for col in range(tiles_per_row)]
+        Rect = pygame.Rect
+        placements = []
+        for row, row_start in enumerate(range(0, len(tiles), tiles_per_row)):
+            dest_y = row * stride
+            for dest_x, tile in zip(x_positions, tiles[row_start:row_start + tiles_per_row]):
+                if tile is None:
+                    continue
+                scaled = scale_tile(tile, scaled_size, scaled_size)
+                placements.append((scaled, Rect(dest_x, dest_y, scaled_size, scaled_size)))
+        return placements
+
+    key = (tileset.tile_count(), scaled_size, spacing, tiles_per_row)
+    stride = scaled_size + spacing
+    grid = TileGrid(0, 0, stride, stride, tiles_per_row, tileset.tile_count(), scaled_size, scaled_size)
+    return renderer.blit_atlas(surface, sidebar_rect, key, build, (start_x, start_y), grid)
+
+
+def _compute_layout(
+    metrics: TileMetrics,
+    available_width: int,
+    available_height: int,
+    base_spacing: int,
+    tiles_per_row: int,
+    max_scale: float,
+) -> tuple[float, int, int, List[int], int]:
+    """Fit variable-size tiles into the available area.
+
+    Pure integer/float math on the tile metrics. Returns ``(scale, spacing,
+    scaled_max_height, scaled_row_widths, grid_width)``.
+    """
+    count = len(metrics.sizes)
+    rows = len(metrics.row_widths)
+    max_height = metrics.max_height
+    row_widths = metrics.row_widths
+    max_row_width = max(row_widths)
+
+    scale_w = (available_width - base_spacing * tiles_per_row) / max_row_width
+    scale_h = (available_height - base_spacing * (rows - 1)) / (max_height * rows)
+
+    scale = min(scale_w, scale_h, max_scale)
+    if scale <= 0:
+        scale = 1
+
+    spacing = int(base_spacing * scale)
+    scaled_max_height = int(max_height * scale)
+
+    scaled_row_widths = [
+        int(w * scale) + spacing * (min(tiles_per_row, count - r * tiles_per_row) - 1)
+        for r, w in enumerate(row_widths)
+    ]
+    return scale, spacing, scaled_max_height, scaled_row_widths, max(scaled_row_widths)
+
+
+def draw_variable_tileset(
+    surface: pygame.Surface,
+    sidebar_rect: pygame.Rect,
+    tileset: TilesetProtocol,
+    max_scale: float = 2,
+) -> TileRects:
+    """Render a tileset whose tiles differ in size and return their rectangles.
+
+    Tiles in a row are bottom-aligned and each row is centred horizontally.
+    """
+    renderer = palette_renderer(tileset)
+    cached = renderer.draw_cached(surface, sidebar_rect)
+    if cached is not None:
+        return cached
+
+    base_spacing = 2
+
+    tiles_per_row = tileset.tiles_per_row()
+
+    # Actual dimensions of each tile, scanned once per loaded tileset
+    metrics = tile_metrics(tileset)
+    if not metrics.sizes or metrics.max_height == 0:
+        return TileRects()
+
+    offset_y = PALETTE_OFFSET_Y
+
+    available_width = sidebar_rect.width
+    available_height = sidebar_rect.height - offset_y
+
+    scale, spacing, scaled_max_height, scaled_row_widths, grid_width = _compute_layout(
+        metrics, available_width, available_height, base_spacing, tiles_per_row, max_scale
+    )
+
+    start_x = sidebar_rect.left + max((available_width - grid_width) // 2, 0)
+    start_y = sidebar_rect.top + offset_y
+
+    def build() -> List[tuple[pygame.Surface, pygame.Rect]]:
+        # Lay tiles out relative to the atlas origin (start_x, start_y)
+        tiles = tileset.tiles
+        row_stride = scaled_max_height + spacing
+        Rect = pygame.Rect
+        placements = []
+        for row, row_start in enumerate(range(0, len(tiles), tiles_per_row)):
+            dest_x = max((grid_width - scaled_row_widths[row]) // 2, 0)
+            row_bottom = row * row_stride + scaled_max_height
+            for tile in tiles[row_start:row_start + tiles_per_row]:
+                if tile is None:
+                    continue
+                scaled_w = int(tile.get_width() * scale)
+                scaled_h = int(tile.get_height() * scale)
+                scaled = scale_tile(tile, scaled_w, scaled_h)
+                placements.append((scaled, Rect(dest_x, row_bottom - scaled_h, scaled_w, scaled_h)))
+                dest_x += scaled_w + spacing
+        return placements
 
-    return rects
+    key = (tileset.tile_count(), scale, spacing)
+    return renderer.blit_atlas(surface, sidebar_rect, key, build, (start_x, start_y))
@@ -3,30 +3,70 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, NamedTuple
 import pygame
 
 from ..color_palette import ORANGE
 
 
+class TileGrid(NamedTuple):
+    """Screen layout of a palette whose tiles sit on a uniform grid."""
+
+    left: int
+    top: int
+    stride_x: int
+    stride_y: int
+    columns: int
+    count: int
+    cell_width: int
+    cell_height: int
+
+    def index_at(self, x: int, y: int) -> int | None:
+        """Return the tile index under ``(x, y)`` or None for gaps/outside."""
+        col, rem_x = divmod(x - self.left, self.stride_x)
+        row, rem_y = divmod(y - self.top, self.stride_y)
+        if not (0 <= col < self.columns) or row < 0:
+            return None
+        if rem_x >= self.cell_width or rem_y >= self.cell_height:
+            return None  # Clicked the spacing between tiles
+        index = row * self.columns + col
+        return index if index < self.count else None
+
+
 class TileSelectionManager:
     """Track and draw tile selections for each tileset."""
 
     def __init__(self) -> None:
         self.selections: Dict[int, int] = {}
         self.tile_rects: Dict[int, List[pygame.Rect]] = {}
+        self.tile_grids: Dict[int, TileGrid] = {}
 
     def set_tile_rects(self, tileset_index: int, rects: List[pygame.Rect]) -> None:
         """Store rectangles for tiles in the given tileset."""
         self.tile_rects[tileset_index] = rects
 
+    def set_tile_grid(self, tileset_index: int, grid: TileGrid | None) -> None:
+        """Store uniform grid metadata so clicks resolve without a rect scan."""
+        if grid is None:
+            self.tile_grids.pop(tileset_index, None)
+        else:
+            self.tile_grids[tileset_index] = grid
+
     def handle_event(self, event: pygame.event.Event, tileset_index: int) -> None:
         """Update selection for the active tileset based on mouse click."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+            grid = self.tile_grids.get(tileset_index)
+            if grid is not None:
+                index = grid.index_at(mx, my)
+                if index is not None:
+                    self.selections[tileset_index] = index
+                return
+
+            # Palettes with variable-size tiles fall back to a rect scan
             rects = self.tile_rects.get(tileset_index)
             if not rects:
                 return
-            mx, my = event.pos
             for index, rect in enumerate(rects):
                 if rect.collidepoint(mx, my):
                     self.selections[tileset_index] = index
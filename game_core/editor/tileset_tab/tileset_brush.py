@@ -2,27 +2,44 @@
 from __future__ import annotations
 # Provides brush button layout and logic wrapped in a bordered container.
 
+from math import isqrt
+
 import pygame
-from typing import Iterator
 
 from ..color_palette import LIGHT_GRAY, DARK_GRAY, SIDEBAR_BORDER, WHITE
-from ..config import FONT_PATH
+from ..editor_font import get_editor_font
+
+
+# Relative (dx, dy) cells covered by each (size, shape) brush, built on first use
+_BRUSH_OFFSETS: dict[tuple[int, str], tuple[tuple[int, int], ...]] = {}
+
+
+def _brush_offsets(size: int, shape: str) -> tuple[tuple[int, int], ...]:
+    """Return the cached offsets covered by a brush of ``size`` and ``shape``."""
+    key = (size, shape)
+    offsets = _BRUSH_OFFSETS.get(key)
+    if offsets is None:
+        radius = size // 2
+        span = range(-radius, radius + 1)
+        if shape == "circle":
+            # Each row of the disk is one contiguous run; no per-cell test
+            limit = radius * radius
+            cells: list[tuple[int, int]] = []
+            for dy in span:
+                half = isqrt(limit - dy * dy)
+                cells.extend((dx, dy) for dx in range(-half, half + 1))
+            offsets = tuple(cells)
+        else:  # square
+            offsets = tuple((dx, dy) for dy in span for dx in span)
+        _BRUSH_OFFSETS[key] = offsets
+    return offsets
 
 
 def iter_brush_positions(
     center_x: int, center_y: int, size: int, shape: str = "square"
-) -> Iterator[tuple[int, int]]:
-    """Yield grid coordinates affected by a brush of the given size and shape."""
-    radius = size // 2
-    if shape == "circle":
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                if dx * dx + dy * dy <= radius * radius:
-                    yield center_x + dx, center_y + dy
-    else:  # square
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                yield center_x + dx, center_y + dy
+) -> list[tuple[int, int]]:
+    """Return grid coordinates affected by a brush of the given size and shape."""
+    return [(center_x + dx, center_y + dy) for dx, dy in _brush_offsets(size, shape)]
 
 
 class TilesetBrush:
@@ -37,7 +54,17 @@ class TilesetBrush:
         self.sidebar_rect = sidebar_rect
         self.selected = 1
         self.shape = "square"
-        self.font = pygame.font.Font(FONT_PATH, 16)
+        self.font = get_editor_font(16)
+
+        # Button captions never change, so rasterize them once
+        self._size_labels = [self.font.render(f"{size}x{size}", True, WHITE) for size in self.SIZES]
+        self._shape_labels = [
+            self.font.render("O" if shape == "circle" else "[]", True, WHITE) for shape in self.SHAPES
+        ]
+
+        # Button faces with the border baked in, one per selection state
+        self._btn_off = self._make_button_face(DARK_GRAY)
+        self._btn_on = self._make_button_face(LIGHT_GRAY)
 
         # Container rect defines the outer box drawn around the buttons
         width_buttons = self.BUTTON_SIZE * len(self.SIZES) + self.PADDING * (len(self.SIZES) - 1)
@@ -50,6 +77,17 @@ class TilesetBrush:
         self._left = self.container_rect.left + self.PADDING
         self._top = self.container_rect.top + self.PADDING
 
+        # Button rects only change with the container, so build them lazily
+        self._rects_dirty = True
+        self._cached_button_rects: list[pygame.Rect] = []
+        self._cached_shape_rects: list[pygame.Rect] = []
+        self._size_label_pos: list[tuple[int, int]] = []
+        self._shape_label_pos: list[tuple[int, int]] = []
+
+        # Prebuilt panel with every button unselected, rebuilt with the rects
+        self._panel: pygame.Surface | None = None
+        self._panel_pos = (0, 0)
+
     def resize(self, sidebar_rect: pygame.Rect) -> None:
         """Update sidebar reference when resized."""
         self.sidebar_rect = sidebar_rect
@@ -58,72 +96,133 @@ class TilesetBrush:
         self.container_rect.width = max(width_buttons, width_shapes) + self.PADDING * 2
         self.container_rect.height = self.BUTTON_SIZE * 2 + self.PADDING * 3
         self.container_rect.left = sidebar_rect.left + self.PADDING
+        self._apply_container()
 
     def set_top(self, top: int) -> None:
         """Set the top y-coordinate for the brush buttons."""
         self.container_rect.top = top - self.PADDING
-        self._top = top
-        self._left = self.container_rect.left + self.PADDING
+        self._apply_container()
 
     def set_container(self, rect: pygame.Rect) -> None:
         """Define the container rectangle for the brush."""
-        self.container_rect = rect
-        self._left = rect.left + self.PADDING
-        self._top = rect.top + self.PADDING
+        # Called every frame by the tab manager; only relayout on change
+        if rect == self.container_rect:
+            return
+        self.container_rect = rect.copy()
+        self._apply_container()
+
+    def _apply_container(self) -> None:
+        """Derive the button origin from ``container_rect`` and mark rects stale."""
+        # Every container change goes through here, so the cached origin
+        # always matches the rect set_container compares against
+        self._left = self.container_rect.left + self.PADDING
+        self._top = self.container_rect.top + self.PADDING
+        self._rects_dirty = True
+
+    def _refresh_rects(self) -> None:
+        """Rebuild the cached button rects after a layout change."""
+        if not self._rects_dirty:
+            return
+        stride = self.BUTTON_SIZE + self.PADDING
+        size = self.BUTTON_SIZE
+        shape_top = self._top + stride
+        self._cached_button_rects = [
+            pygame.Rect(self._left + i * stride, self._top, size, size)
+            for i in range(len(self.SIZES))
+        ]
+        self._cached_shape_rects = [
+            pygame.Rect(self._left + i * stride, shape_top, size, size)
+            for i in range(len(self.SHAPES))
+        ]
+        # Captions are centred in their buttons; store the blit positions
+        self._size_label_pos = [
+            label.get_rect(center=rect.center).topleft
+            for label, rect in zip(self._size_labels, self._cached_button_rects)
+        ]
+        self._shape_label_pos = [
+            label.get_rect(center=rect.center).topleft
+            for label, rect in zip(self._shape_labels, self._cached_shape_rects)
+        ]
+        self._rects_dirty = False
+        self._build_panel()
+
+    def _build_panel(self) -> None:
+        """Render the container and all unselected buttons to one surface."""
+        rects = self._cached_button_rects + self._cached_shape_rects
+        labels = self._size_labels + self._shape_labels
+        positions = self._size_label_pos + self._shape_label_pos
+        area = self.container_rect.unionall(rects)
+        panel = pygame.Surface(area.size, pygame.SRCALPHA)
+        ox, oy = area.topleft
+
+        local = self.container_rect.move(-ox, -oy)
+        pygame.draw.rect(panel, DARK_GRAY, local)
+        pygame.draw.rect(panel, SIDEBAR_BORDER, local, 1)
+        for rect, label, (x, y) in zip(rects, labels, positions):
+            self._draw_button(panel, rect.move(-ox, -oy), label, (x - ox, y - oy), self._btn_off)
+
+        if pygame.display.get_surface() is not None:
+            panel = panel.convert_alpha()
+        self._panel = panel
+        self._panel_pos = area.topleft
+
+    def _make_button_face(self, color) -> pygame.Surface:
+        face = pygame.Surface((self.BUTTON_SIZE, self.BUTTON_SIZE))
+        face.fill(color)
+        pygame.draw.rect(face, SIDEBAR_BORDER, face.get_rect(), 1)
+        return face
+
+    @staticmethod
+    def _draw_button(surface: pygame.Surface, rect: pygame.Rect, label: pygame.Surface,
+                     label_pos: tuple[int, int], face: pygame.Surface) -> None:
+        surface.blit(face, rect.topleft)
+        surface.blit(label, label_pos)
 
     def _button_rects(self) -> list[pygame.Rect]:
-        rects = []
-        x = self._left
-        y = self._top
-        for _ in self.SIZES:
-            rects.append(pygame.Rect(x, y, self.BUTTON_SIZE, self.BUTTON_SIZE))
-            x += self.BUTTON_SIZE + self.PADDING
-        return rects
+        self._refresh_rects()
+        return self._cached_button_rects
 
     def _shape_rects(self) -> list[pygame.Rect]:
-        rects = []
-        x = self._left
-        y = self._top + self.BUTTON_SIZE + self.PADDING
-        for _ in self.SHAPES:
-            rects.append(pygame.Rect(x, y, self.BUTTON_SIZE, self.BUTTON_SIZE))
-            x += self.BUTTON_SIZE + self.PADDING
-        return rects
+        self._refresh_rects()
+        return self._cached_shape_rects
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mx, my = event.pos
-            if not self.container_rect.collidepoint(mx, my):
+            cr = self.container_rect
+            if not (cr.left <= mx < cr.right and cr.top <= my < cr.bottom):
                 return
-            for size, rect in zip(self.SIZES, self._button_rects()):
-                if rect.collidepoint(mx, my):
-                    self.selected = size
-                    return
-            for shape, rect in zip(self.SHAPES, self._shape_rects()):
-                if rect.collidepoint(mx, my):
-                    self.shape = shape
-                    return
+            # Buttons sit on a fixed grid: sizes on row 0, shapes on row 1
+            stride = self.BUTTON_SIZE + self.PADDING
+            col, rem_x = divmod(mx - self._left, stride)
+            row, rem_y = divmod(my - self._top, stride)
+            if col < 0 or rem_x >= self.BUTTON_SIZE or rem_y >= self.BUTTON_SIZE:
+                return  # Left of the buttons or in the padding between them
+            if row == 0 and col < len(self.SIZES):
+                self.selected = self.SIZES[col]
+            elif row == 1 and col < len(self.SHAPES):
+                self.shape = self.SHAPES[col]
 
     def draw(self, surface: pygame.Surface) -> None:
-        pygame.draw.rect(surface, DARK_GRAY, self.container_rect)
-        pygame.draw.rect(surface, SIDEBAR_BORDER, self.container_rect, 1)
-        for size, rect in zip(self.SIZES, self._button_rects()):
-            color = LIGHT_GRAY if size == self.selected else DARK_GRAY
-            pygame.draw.rect(surface, color, rect)
-            pygame.draw.rect(surface, SIDEBAR_BORDER, rect, 1)
-
-            label = self.font.render(f"{size}x{size}", True, WHITE)
-            label_rect = label.get_rect(center=rect.center)
-            surface.blit(label, label_rect)
-
-        for shape, rect in zip(self.SHAPES, self._shape_rects()):
-            color = LIGHT_GRAY if shape == self.shape else DARK_GRAY
-            pygame.draw.rect(surface, color, rect)
-            pygame.draw.rect(surface, SIDEBAR_BORDER, rect, 1)
-
-            text = "O" if shape == "circle" else "[]"
-            label = self.font.render(text, True, WHITE)
-            label_rect = label.get_rect(center=rect.center)
-            surface.blit(label, label_rect)
+        self._refresh_rects()
+        surface.blit(self._panel, self._panel_pos)
+
+        # Only the selected buttons differ from the prebuilt panel
+        for i, size in enumerate(self.SIZES):
+            if size == self.selected:
+                self._draw_button(surface, self._cached_button_rects[i], self._size_labels[i],
+                                  self._size_label_pos[i], self._btn_on)
+        for i, shape in enumerate(self.SHAPES):
+            if shape == self.shape:
+                self._draw_button(surface, self._cached_shape_rects[i], self._shape_labels[i],
+                                  self._shape_label_pos[i], self._btn_on)
+
+
+# Warm the offset table for every brush the UI offers
+for _size in TilesetBrush.SIZES:
+    for _shape in TilesetBrush.SHAPES:
+        _brush_offsets(_size, _shape)
+del _size, _shape
 
 
 __all__ = ["TilesetBrush", "iter_brush_positions"]
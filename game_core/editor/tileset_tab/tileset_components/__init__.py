@@ -1,6 +1,9 @@
 """Tileset component exports."""
 # Collects tileset component classes into one namespace.
 
+from typing import Callable, Dict, List, Type, TypeVar
+
+from ._base import BaseTileset
 from .overworld_tileset import OverworldTileset
 from .overworld_anim_tileset import OverworldAnimTileset
 from .dungeon_tileset import DungeonTileset
@@ -8,6 +11,43 @@ from .dungeon_anim_tileset import DungeonAnimTileset
 from .player_spawnpoint import PlayerSpawnpointTileset
 from .enemy_spawnpoint import EnemySpawnpointTileset
 
+T = TypeVar("T", bound=BaseTileset)
+
+# One lazily loaded instance per tileset class, shared by all palettes
+_shared_tilesets: Dict[type, BaseTileset] = {}
+
+# Called after the shared tilesets are unloaded (e.g. by palette renderers)
+_unload_callbacks: List[Callable[[], None]] = []
+
+
+def add_unload_callback(callback: Callable[[], None]) -> None:
+    """Register ``callback`` to run whenever ``unload_tilesets`` is called."""
+    if callback not in _unload_callbacks:
+        _unload_callbacks.append(callback)
+
+
+def get_tileset(tileset_cls: Type[T]) -> T:
+    """Return the shared instance of ``tileset_cls``, loading it on first use."""
+    tileset = _shared_tilesets.get(tileset_cls)
+    if tileset is None:
+        tileset = tileset_cls()
+        _shared_tilesets[tileset_cls] = tileset
+    return tileset
+
+
+def unload_tilesets() -> None:
+    """Unload every shared tileset; the next ``get_tileset`` reloads it.
+
+    Registered unload callbacks run afterwards so dependent caches are
+    released as well.
+    """
+    for tileset in _shared_tilesets.values():
+        tileset.unload()
+    _shared_tilesets.clear()
+    for callback in _unload_callbacks:
+        callback()
+
+
 __all__ = [
     "OverworldTileset",
     "OverworldAnimTileset",
@@ -15,4 +55,7 @@ __all__ = [
     "DungeonAnimTileset",
     "PlayerSpawnpointTileset",
     "EnemySpawnpointTileset",
+    "get_tileset",
+    "unload_tilesets",
+    "add_unload_callback",
 ]
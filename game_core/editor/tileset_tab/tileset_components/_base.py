@@ -0,0 +1,51 @@
+"""Base class shared by the editor's tileset palette loaders."""
+# Holds the loaded tiles and the accessors every palette relies on.
+
+from __future__ import annotations
+
+import abc
+
+import pygame
+
+
+class BaseTileset(abc.ABC):
+    """Store loaded tiles and expose the palette lookup helpers."""
+
+    __slots__ = ("tiles",)
+
+    TILE_SIZE = 16
+    # Dimensions of the palette layout (in pixels); subclasses override these
+    TILESET_WIDTH = TILE_SIZE
+    TILESET_HEIGHT = TILE_SIZE
+
+    def __init__(self) -> None:
+        self.tiles: tuple[pygame.Surface, ...] | list[pygame.Surface] = []
+        self.load_tiles()
+        # Tiles never change after loading; a tuple is compact and read-only
+        self.tiles = tuple(self.tiles)
+
+    @abc.abstractmethod
+    def load_tiles(self) -> None:
+        """Append tiles to ``self.tiles``; implemented by each loader."""
+
+    def unload(self) -> None:
+        """Release the loaded tiles so sprite_cache can reclaim them."""
+        self.tiles = ()
+
+    def tiles_per_row(self) -> int:
+        """Return the number of tiles per row in the palette layout."""
+        return self.TILESET_WIDTH // self.TILE_SIZE
+
+    def get_tile(self, index: int) -> pygame.Surface | None:
+        """Return the tile surface at the specified index."""
+        tiles = self.tiles
+        if 0 <= index < len(tiles):
+            return tiles[index]
+        return None
+
+    def tile_count(self) -> int:
+        """Return the number of loaded tiles."""
+        return len(self.tiles)
+
+
+__all__ = ["BaseTileset"]
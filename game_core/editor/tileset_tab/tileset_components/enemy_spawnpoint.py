@@ -4,17 +4,20 @@
 from __future__ import annotations
 
 import os
-import pygame
+from operator import attrgetter
 
+from game_core.editor.fs_utils import is_png
 from game_core.editor.image_cache import sprite_cache
 
+from ._base import BaseTileset
 
-class EnemySpawnpointTileset:
+
+class EnemySpawnpointTileset(BaseTileset):
     """Load preview tiles for enemy spawn points from various enemy folders."""
 
-    TILE_SIZE = 16
-    TILESET_WIDTH = TILE_SIZE * 6
-    TILESET_HEIGHT = TILE_SIZE
+    __slots__ = ("enemies_root", "enemy_folders")
+
+    TILESET_WIDTH = BaseTileset.TILE_SIZE * 6
 
     def __init__(self, enemies_root: str = "Enemies_Sprites") -> None:
         self.enemies_root = enemies_root
@@ -31,39 +34,34 @@ class EnemySpawnpointTileset:
             "Spider_Sprites/spider_idle_anim_all_dir",
             "Spinner_Sprites/spinner_idle_anim_all_dir",
         ]
-        self.tiles: list[pygame.Surface] = []
-        self.load_tiles()
-
-    def tiles_per_row(self) -> int:
-        """Return the number of tiles per row in the preview tileset."""
-        return self.TILESET_WIDTH // self.TILE_SIZE
+        super().__init__()
 
     def _find_first_png(self, folder: str) -> str | None:
-        for root, _dirs, files in os.walk(folder):
-            png_files = [f for f in files if f.endswith(".png")]
-            png_files.sort()
-            if png_files:
-                return os.path.join(root, png_files[0])
+        """Return the first PNG in ``folder``, searching subfolders only if needed."""
+        with os.scandir(folder) as it:
+            entries = list(it)
+        by_name = attrgetter("name")
+        # Only the first name is needed, so a linear min beats a full sort
+        first = min((e for e in entries if is_png(e.name) and e.is_file()), key=by_name, default=None)
+        if first is not None:
+            return first.path
+        for entry in sorted((e for e in entries if e.is_dir()), key=by_name):
+            found = self._find_first_png(entry.path)
+            if found:
+                return found
         return None
 
     def load_tiles(self) -> None:
         """Load the first frame from each enemy folder."""
+        paths = []
         for folder in self.enemy_folders:
             base_path = os.path.join(self.enemies_root, folder)
             if not os.path.isdir(base_path):
                 continue
             first_png = self._find_first_png(base_path)
-            if first_png and os.path.isfile(first_png):
-                sprite = sprite_cache.get_sprite(first_png)
-                if sprite is not None:
-                    self.tiles.append(sprite)
-
-    def get_tile(self, index: int) -> pygame.Surface | None:
-        """Return the tile surface at the specified index."""
-        if 0 <= index < len(self.tiles):
-            return self.tiles[index]
-        return None
+            if first_png:
+                paths.append(first_png)
 
-    def tile_count(self) -> int:
-        """Return the number of loaded tiles."""
-        return len(self.tiles)
+        for sprite in sprite_cache.get_sprites(paths):
+            if sprite is not None:
+                self.tiles.append(sprite)
@@ -4,26 +4,20 @@
 from __future__ import annotations
 
 import os
-import pygame
 
 from game_core.editor.image_cache import sprite_cache
 
+from ._base import BaseTileset
 
-class PlayerSpawnpointTileset:
+
+class PlayerSpawnpointTileset(BaseTileset):
     """Load the player spawn point preview tile."""
 
-    TILE_SIZE = 16
-    TILESET_WIDTH = TILE_SIZE
-    TILESET_HEIGHT = TILE_SIZE
+    __slots__ = ("tile_path",)
 
     def __init__(self, tile_path: str = "character/char_idle_down/tile000.png") -> None:
         self.tile_path = tile_path
-        self.tiles: list[pygame.Surface] = []
-        self.load_tiles()
-
-    def tiles_per_row(self) -> int:
-        """Return the number of tiles per row in this tileset."""
-        return 1
+        super().__init__()
 
     def load_tiles(self) -> None:
         """Load the player spawn tile if it exists."""
@@ -33,13 +27,3 @@ class PlayerSpawnpointTileset:
         sprite = sprite_cache.get_sprite(self.tile_path)
         if sprite is not None:
             self.tiles.append(sprite)
-
-    def get_tile(self, index: int) -> pygame.Surface | None:
-        """Return the tile surface at the specified index."""
-        if 0 <= index < len(self.tiles):
-            return self.tiles[index]
-        return None
-
-    def tile_count(self) -> int:
-        """Return the number of loaded tiles."""
-        return len(self.tiles)
@@ -7,7 +7,7 @@ from typing import List
 import pygame
 
 from ..color_palette import LIGHT_GRAY, DARK_GRAY, SIDEBAR_BORDER, WHITE
-from ..config import FONT_PATH
+from ..editor_font import get_editor_font
 
 
 class TilesetLayers:
@@ -20,7 +20,7 @@ class TilesetLayers:
 
     def __init__(self, sidebar_rect: pygame.Rect) -> None:
         self.sidebar_rect = sidebar_rect
-        self.font = pygame.font.Font(FONT_PATH, 16)
+        self.font = get_editor_font(16)
         self.layers: List[str] = ["Layer 1"]
         self.active = 0
         # Container the component is drawn within
@@ -28,44 +28,83 @@ class TilesetLayers:
         self.scroll_offset = 0
         self._left = self.container_rect.left + self.PADDING
         self._top = self.container_rect.top + self.PADDING
+        self._max_scroll = 0
+        self._recompute_max_scroll()
+
+        # Rendered layer names keyed by text; the button glyphs never change
+        self._label_cache: dict[str, pygame.Surface] = {}
+        self._plus_label = self.font.render("+", True, WHITE)
+        self._minus_label = self.font.render("-", True, WHITE)
+
+        # Button rects are rebuilt only after layout, scroll or layer changes
+        self._rects_dirty = True
+        self._cached_rects: List[pygame.Rect] = []
+        self._add_rect_cached = pygame.Rect(0, 0, 0, 0)
+        self._del_rect_cached = pygame.Rect(0, 0, 0, 0)
+
+        # Prebuilt button faces (fill plus border); layer faces follow the width
+        self._btn_small = self._make_face((self.BUTTON_SIZE, self.BUTTON_SIZE), DARK_GRAY)
+        self._btn_active: pygame.Surface | None = None
+        self._btn_inactive: pygame.Surface | None = None
+
+        # Whole component rendered off-screen; redrawn only when marked dirty
+        self._cached_surface: pygame.Surface | None = None
+        self._content_surface: pygame.Surface | None = None
+        self._surf_dirty = True
 
     def resize(self, sidebar_rect: pygame.Rect) -> None:
         """Update sidebar reference when resized."""
         self.sidebar_rect = sidebar_rect
         self.container_rect = sidebar_rect.copy()
-        self._left = self.container_rect.left + self.PADDING
+        self._apply_container()
+        self._recompute_max_scroll()
 
     def set_top(self, top: int) -> None:
         """Set the top y-coordinate for the layer buttons."""
         self.container_rect.top = top
-        self._top = self.container_rect.top + self.PADDING
+        self._apply_container()
 
     def set_position(self, left: int, top: int) -> None:
         """Set the x/y position for the component."""
         self.container_rect.topleft = (left, top)
-        self._left = self.container_rect.left + self.PADDING
-        self._top = self.container_rect.top + self.PADDING
+        self._apply_container()
 
     def set_container(self, rect: pygame.Rect) -> None:
         """Define the container rectangle for the layer list."""
-        self.container_rect = rect
+        # Called every frame by the tab manager; only relayout on change
+        if rect == self.container_rect:
+            return
+        self.container_rect = rect.copy()
+        self._apply_container()
+        self._recompute_max_scroll()
+
+    def _apply_container(self) -> None:
+        """Derive the row origin from ``container_rect`` and mark rects stale."""
+        # Every container change goes through here, so the cached origin
+        # always matches the rect set_container compares against
         self._left = self.container_rect.left + self.PADDING
         self._top = self.container_rect.top + self.PADDING
+        self._rects_dirty = True
+
+    def _recompute_max_scroll(self) -> None:
+        """Update the scroll limit after the layer count or height changes."""
+        total = (self.LAYER_HEIGHT + self.PADDING) * (len(self.layers) + 1)
+        self._max_scroll = max(0, total - self.container_rect.height)
 
     def scroll(self, amount: int) -> None:
         """Scroll the layer list vertically by ``amount`` pixels."""
-        total = (self.LAYER_HEIGHT + self.PADDING) * (len(self.layers) + 1)
-        max_scroll = max(0, total - self.container_rect.height)
-        if max_scroll <= 0:
-            self.scroll_offset = 0
-            return
-        self.scroll_offset = max(0, min(self.scroll_offset + amount, max_scroll))
+        old_offset = self.scroll_offset
+        self.scroll_offset = max(0, min(self.scroll_offset + amount, self._max_scroll))
+        if self.scroll_offset != old_offset:
+            self._rects_dirty = True
 
     def add_layer(self, name: str | None = None) -> None:
         """Create a new layer and make it active."""
         name = name or f"Layer {len(self.layers) + 1}"
         self.layers.append(name)
         self.active = len(self.layers) - 1
+        self._rects_dirty = True
+        self._recompute_max_scroll()
 
     def delete_layer(self, index: int | None = None) -> int | None:
         """Remove a layer by index or the active layer if unspecified."""
@@ -77,6 +116,8 @@ class TilesetLayers:
             self.layers.pop(index)
             if self.active >= len(self.layers):
                 self.active = len(self.layers) - 1
+            self._rects_dirty = True
+            self._recompute_max_scroll()
             return index
         return None
 
@@ -84,32 +125,71 @@ class TilesetLayers:
         """Set which layer new tiles are placed on."""
         if 0 <= index < len(self.layers):
             self.active = index
+            self._surf_dirty = True
 
-    def _layer_rects(self) -> List[pygame.Rect]:
-        """Return rectangles for each layer button."""
-        rects = []
-        x = self._left
-        width = min(
+    def _render_label(self, text: str) -> pygame.Surface:
+        """Return the rendered label for ``text``, rendering it only once."""
+        label = self._label_cache.get(text)
+        if label is None:
+            label = self.font.render(text, True, WHITE)
+            self._label_cache[text] = label
+        return label
+
+    def _row_width(self) -> int:
+        """Return the width of a layer row, shared by drawing and hit-testing."""
+        return min(
             self.LAYER_WIDTH,
             self.container_rect.width - self.BUTTON_SIZE - self.PADDING * 3,
         )
+
+    def _refresh_rects(self) -> None:
+        """Rebuild the cached layer and button rects after a change."""
+        if not self._rects_dirty:
+            return
+        rects = []
+        x = self._left
+        width = self._row_width()
         y = self._top - self.scroll_offset
         for _ in self.layers:
             rects.append(pygame.Rect(x, y, width, self.LAYER_HEIGHT))
             y += self.LAYER_HEIGHT + self.PADDING
-        return rects
+        self._cached_rects = rects
+
+        size = (max(width, 0), self.LAYER_HEIGHT)
+        if self._btn_active is None or self._btn_active.get_size() != size:
+            self._btn_active = self._make_face(size, LIGHT_GRAY)
+            self._btn_inactive = self._make_face(size, DARK_GRAY)
 
-    def _add_rect(self) -> pygame.Rect:
-        """Return the rectangle for the add-layer button."""
         x = self.container_rect.right - self.BUTTON_SIZE - self.PADDING
         y = self.container_rect.top + self.PADDING
-        return pygame.Rect(x, y, self.BUTTON_SIZE, self.BUTTON_SIZE)
+        self._add_rect_cached = pygame.Rect(x, y, self.BUTTON_SIZE, self.BUTTON_SIZE)
+        y += self.BUTTON_SIZE + self.PADDING
+        self._del_rect_cached = pygame.Rect(x, y, self.BUTTON_SIZE, self.BUTTON_SIZE)
+        self._rects_dirty = False
+        self._surf_dirty = True
+
+    @staticmethod
+    def _make_face(size: tuple[int, int], color) -> pygame.Surface:
+        """Return a button face of ``size`` filled with ``color`` and bordered."""
+        face = pygame.Surface(size)
+        face.fill(color)
+        pygame.draw.rect(face, SIDEBAR_BORDER, face.get_rect(), 1)
+        return face
+
+    def _layer_rects(self) -> List[pygame.Rect]:
+        """Return rectangles for each layer button."""
+        self._refresh_rects()
+        return self._cached_rects
+
+    def _add_rect(self) -> pygame.Rect:
+        """Return the rectangle for the add-layer button."""
+        self._refresh_rects()
+        return self._add_rect_cached
 
     def _delete_rect(self) -> pygame.Rect:
         """Return the rectangle for the delete-layer button."""
-        x = self.container_rect.right - self.BUTTON_SIZE - self.PADDING
-        y = self.container_rect.top + self.BUTTON_SIZE + self.PADDING * 2
-        return pygame.Rect(x, y, self.BUTTON_SIZE, self.BUTTON_SIZE)
+        self._refresh_rects()
+        return self._del_rect_cached
 
     def handle_event(self, event: pygame.event.Event) -> str | tuple[str, int] | None:
         """Handle mouse clicks to change the active layer.
@@ -128,10 +208,12 @@ class TilesetLayers:
                 if removed is not None:
                     return "delete", removed
                 return None
-            for index, rect in enumerate(self._layer_rects()):
-                if rect.collidepoint(mx, my):
-                    self.active = index
-                    break
+            # Layer rows are evenly spaced, so the row index follows from y
+            stride = self.LAYER_HEIGHT + self.PADDING
+            index, rem_y = divmod(my - (self._top - self.scroll_offset), stride)
+            if (0 <= index < len(self.layers) and rem_y < self.LAYER_HEIGHT
+                    and self._left <= mx < self._left + self._row_width()):
+                self.set_active(index)
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button in (4, 5):
             mx, my = pygame.mouse.get_pos()
             if self.container_rect.collidepoint(mx, my):
@@ -143,33 +225,49 @@ class TilesetLayers:
                 self.scroll(-event.y * (self.LAYER_HEIGHT + self.PADDING))
         return None
 
+    def _render_surface(self) -> None:
+        """Redraw the background, layer buttons and controls off-screen."""
+        size = (max(self.container_rect.width, 0), max(self.container_rect.height, 0))
+        cached = self._cached_surface
+        if cached is None or cached.get_size() != size:
+            cached = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                cached = cached.convert()
+            self._cached_surface = cached
+            # Buttons draw into a view inside the border, which clips them
+            # without toggling the surface's clip rect
+            inner = pygame.Rect(0, 0, size[0] - 1, size[1] - 1).clip(cached.get_rect())
+            self._content_surface = cached.subsurface(inner)
+        ox, oy = self.container_rect.topleft
+        local = cached.get_rect()
+        pygame.draw.rect(cached, DARK_GRAY, local)
+        pygame.draw.rect(cached, SIDEBAR_BORDER, local, 1)
+        add_rect = self._add_rect_cached.move(-ox, -oy)
+        del_rect = self._del_rect_cached.move(-ox, -oy)
+        plus = self._plus_label
+        minus = self._minus_label
+
+        # Faces and labels in draw order, handed to SDL in a single call
+        sequence = []
+        for index, rect in enumerate(self._cached_rects):
+            rect = rect.move(-ox, -oy)
+            face = self._btn_active if index == self.active else self._btn_inactive
+            label = self._render_label(self.layers[index])
+            sequence.append((face, rect))
+            sequence.append((label, label.get_rect(center=rect.center)))
+        sequence.append((self._btn_small, add_rect))
+        sequence.append((self._btn_small, del_rect))
+        sequence.append((plus, plus.get_rect(center=add_rect.center)))
+        sequence.append((minus, minus.get_rect(center=del_rect.center)))
+        self._content_surface.blits(sequence, doreturn=False)
+        self._surf_dirty = False
+
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the layer buttons."""
-        pygame.draw.rect(surface, DARK_GRAY, self.container_rect)
-        pygame.draw.rect(surface, SIDEBAR_BORDER, self.container_rect, 1)
-        old_clip = surface.get_clip()
-        surface.set_clip(self.container_rect.inflate(-1, -1))
-        for index, rect in enumerate(self._layer_rects()):
-            color = LIGHT_GRAY if index == self.active else DARK_GRAY
-            pygame.draw.rect(surface, color, rect)
-            pygame.draw.rect(surface, SIDEBAR_BORDER, rect, 1)
-
-            label = self.font.render(self.layers[index], True, WHITE)
-            label_rect = label.get_rect(center=rect.center)
-            surface.blit(label, label_rect)
-
-        add_rect = self._add_rect()
-        del_rect = self._delete_rect()
-        pygame.draw.rect(surface, DARK_GRAY, add_rect)
-        pygame.draw.rect(surface, SIDEBAR_BORDER, add_rect, 1)
-        pygame.draw.rect(surface, DARK_GRAY, del_rect)
-        pygame.draw.rect(surface, SIDEBAR_BORDER, del_rect, 1)
-
-        plus = self.font.render("+", True, WHITE)
-        minus = self.font.render("-", True, WHITE)
-        surface.blit(plus, plus.get_rect(center=add_rect.center))
-        surface.blit(minus, minus.get_rect(center=del_rect.center))
-        surface.set_clip(old_clip)
+        self._refresh_rects()
+        if self._surf_dirty:
+            self._render_surface()
+        surface.blit(self._cached_surface, self.container_rect.topleft)
 
 
 __all__ = ["TilesetLayers"]
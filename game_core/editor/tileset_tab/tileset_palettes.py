@@ -12,26 +12,38 @@ from .show_tileset.show_dungeon_anim_tileset import draw_tileset as draw_dungeon
 from .show_tileset.show_player_spawnpoint import draw_tileset as draw_player_spawnpoint
 from .show_tileset.show_enemy_spawnpoint import draw_tileset as draw_enemy_spawnpoint
 from .tile_selection_manager import TileSelectionManager
+from . import tileset_tab_constants as layout
 
 from ..color_palette import LIGHT_GRAY, DARK_GRAY, SIDEBAR_BORDER, WHITE
-from ..config import FONT_PATH
+from ..editor_font import get_editor_font
 
 
 class TilesetPalettes:
     """Manage numeric tileset tabs (1-6) inside the tiles tab."""
 
-    TAB_HEIGHT = 30
-    TAB_WIDTH = 30
-    PADDING = 5
+    TAB_HEIGHT = layout.TAB_HEIGHT
+    TAB_WIDTH = layout.TAB_WIDTH
+    PADDING = layout.PADDING
+    OFFSET_Y = layout.PALETTE_OFFSET_Y  # Top of the palette below the tabs
 
     def __init__(self, sidebar_rect: pygame.Rect,
                  selection_manager: TileSelectionManager | None = None) -> None:
         self.sidebar_rect = sidebar_rect
-        self.font = pygame.font.Font(FONT_PATH, 16)
+        self.font = get_editor_font(16)
         self.selection_manager = selection_manager or TileSelectionManager()
 
         self.tilesets = [str(i) for i in range(1, 7)]
+        # Tab captions are static, so render them once
+        self._label_surfs = [self.font.render(name, True, WHITE) for name in self.tilesets]
+        # Tab faces with the border baked in, one per selection state
+        self._tab_bg_active = self._make_tab_face(LIGHT_GRAY)
+        self._tab_bg_inactive = self._make_tab_face(DARK_GRAY)
         self.active = 0
+
+        # Tab rects and label positions only move when the sidebar resizes
+        self._rects_dirty = True
+        self._cached_rects: list[pygame.Rect] = []
+        self._label_pos: list[tuple[int, int]] = []
         self._drawers = [
             draw_overworld_tileset,
             draw_overworld_anim_tileset,
@@ -44,6 +56,13 @@ class TilesetPalettes:
     def resize(self, sidebar_rect: pygame.Rect) -> None:
         """Update position and size when the sidebar changes."""
         self.sidebar_rect = sidebar_rect
+        self._rects_dirty = True
+
+    def _make_tab_face(self, color) -> pygame.Surface:
+        face = pygame.Surface((self.TAB_WIDTH, self.TAB_HEIGHT))
+        face.fill(color)
+        pygame.draw.rect(face, SIDEBAR_BORDER, face.get_rect(), 1)
+        return face
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle mouse clicks to switch tilesets and select tiles."""
@@ -56,14 +75,21 @@ class TilesetPalettes:
             self.selection_manager.handle_event(event, self.active)
 
     def _tileset_rects(self) -> list[pygame.Rect]:
-        rects = []
-        x = self.sidebar_rect.left + self.PADDING
-        y = self.sidebar_rect.top + self.PADDING * 2 + self.TAB_HEIGHT
-        for _ in self.tilesets:
-            rect = pygame.Rect(x, y, self.TAB_WIDTH, self.TAB_HEIGHT)
-            rects.append(rect)
-            x += self.TAB_WIDTH + self.PADDING
-        return rects
+        if self._rects_dirty:
+            rects = []
+            x = self.sidebar_rect.left + self.PADDING
+            y = self.sidebar_rect.top + self.PADDING * 2 + self.TAB_HEIGHT
+            for _ in self.tilesets:
+                rect = pygame.Rect(x, y, self.TAB_WIDTH, self.TAB_HEIGHT)
+                rects.append(rect)
+                x += self.TAB_WIDTH + self.PADDING
+            self._cached_rects = rects
+            self._label_pos = [
+                label.get_rect(center=rect.center).topleft
+                for label, rect in zip(self._label_surfs, rects)
+            ]
+            self._rects_dirty = False
+        return self._cached_rects
 
     def draw(self, surface: pygame.Surface) -> int:
         """Draw tileset tabs and the active palette.
@@ -71,21 +97,21 @@ class TilesetPalettes:
         Returns the bottom y-coordinate of the palette for layout purposes.
         """
         bottom = self.sidebar_rect.top
-        for index, rect in enumerate(self._tileset_rects()):
-            color = LIGHT_GRAY if index == self.active else DARK_GRAY
-            pygame.draw.rect(surface, color, rect)
-            pygame.draw.rect(surface, SIDEBAR_BORDER, rect, 1)
-
-            label = self.font.render(self.tilesets[index], True, WHITE)
-            label_rect = label.get_rect(center=rect.center)
-            surface.blit(label, label_rect)
+        faces = [
+            (self._tab_bg_active if index == self.active else self._tab_bg_inactive, rect)
+            for index, rect in enumerate(self._tileset_rects())
+        ]
+        surface.blits(faces, doreturn=False)
+        surface.blits(list(zip(self._label_surfs, self._label_pos)), doreturn=False)
 
         if self.active < len(self._drawers):
             drawer = self._drawers[self.active]
             rects = drawer(surface, self.sidebar_rect)
-            if rects:
-                bottom = max(r.bottom for r in rects)
+            if rects.bottom is not None:
+                bottom = rects.bottom
             self.selection_manager.set_tile_rects(self.active, rects)
+            # Uniform palettes publish their grid for O(1) click lookup
+            self.selection_manager.set_tile_grid(self.active, rects.grid)
             self.selection_manager.draw_selection(surface, self.active)
 
         return bottom
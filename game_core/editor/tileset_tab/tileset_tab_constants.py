@@ -0,0 +1,10 @@
+"""Layout constants shared by the tiles tab components."""
+# Kept free of imports so palette drawers can use them without cycles.
+
+# Numeric tileset tabs (1-6) above the palette
+TAB_HEIGHT = 30
+TAB_WIDTH = 30
+PADDING = 5
+
+# Vertical space above the palette: sidebar tabs, tileset tabs and padding
+PALETTE_OFFSET_Y = PADDING * 3 + TAB_HEIGHT * 2
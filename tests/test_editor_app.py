@@ -0,0 +1,37 @@
+"""Tests for the editor application's redraw tracking."""
+# Runs the editor headless through SDL's dummy video driver.
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def app(monkeypatch):
+    # Asset paths are relative to the repository root
+    monkeypatch.chdir(ROOT)
+    import editor_app
+
+    application = editor_app.EditorApp()
+    application.handle_events()
+    application.draw()
+    yield application
+    pygame.quit()
+
+
+def test_resize_marks_new_screen_dirty(app):
+    pygame.event.post(pygame.event.Event(pygame.VIDEORESIZE, size=(1600, 900), w=1600, h=900))
+    app.handle_events()
+
+    screen_rect = app.screen.get_rect()
+    assert screen_rect.size == (1600, 900)
+    pending = app.dirty.pending()
+    assert pending
+    assert pending[0].unionall(pending[1:]).contains(screen_rect)
+    assert app.dirty.is_dirty(app.sidebar.rect)